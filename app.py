@@ -6,16 +6,47 @@ A Flask web application for generating RouterOS configuration files
 
 from flask import Flask, render_template, request, send_from_directory, jsonify
 import os
+import threading
 
 app = Flask(__name__)
+# Hand config downloads to a fronting server that honours X-Sendfile
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
 
 # Ensure config directory exists
-os.makedirs('configs', exist_ok=True)
+CONFIGS_DIR = os.path.join(app.root_path, 'configs')
+os.makedirs(CONFIGS_DIR, exist_ok=True)
+
+# Load the LAN IP snippet once; /generate only substitutes into it
+with open(os.path.join(app.root_path, 'snippets', 'lan_ip.rsc')) as f:
+    LAN_IP_SNIPPET = f.read()
+
+def _atomic_write(path, data):
+    """Write bytes to path so readers never see a partially written file"""
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        # A buffered file retries short writes until all of data is written
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# index.html takes no context, so it is rendered once and reused
+_index_html = None
 
 @app.route('/')
 def index():
     """Main configuration interface"""
-    return render_template('index.html')
+    global _index_html
+    if _index_html is None or app.debug:
+        _index_html = render_template('index.html')
+    return _index_html
 
 @app.route('/generate', methods=['POST'])
 def generate():
@@ -27,13 +58,10 @@ def generate():
         return jsonify({'error': 'MAC and LAN IP required'}), 400
     
     try:
-        # Read LAN IP snippet and substitute
-        with open('snippets/lan_ip.rsc') as f:
-            snippet = f.read().replace('<LAN_IP>', lan_ip)
+        snippet = LAN_IP_SNIPPET.replace('<LAN_IP>', lan_ip)
         
-        config_path = os.path.join('configs', f'{mac}.rsc')
-        with open(config_path, 'w') as f:
-            f.write(snippet)
+        config_path = os.path.join(CONFIGS_DIR, f'{mac}.rsc')
+        _atomic_write(config_path, snippet.encode('utf-8'))
         
         return jsonify({'success': True, 'mac': mac, 'config_url': f'/config/{mac}.rsc'})
     
@@ -43,7 +71,10 @@ def generate():
 @app.route('/config/<mac>.rsc')
 def serve_config(mac):
     """Serve RouterOS configuration files"""
-    return send_from_directory('configs', f'{mac}.rsc', mimetype='text/plain')
+    return send_from_directory(CONFIGS_DIR, f'{mac}.rsc', mimetype='text/plain',
+                               conditional=True)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Debugger and reloader only when explicitly developing
+    debug = os.environ.get('FLASK_ENV') == 'development'
+    app.run(host='0.0.0.0', port=5000, debug=debug)
@@ -0,0 +1 @@
+# Makes the repo root importable so plain `pytest` finds app.py
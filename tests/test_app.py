@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import app as app_module
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, 'CONFIGS_DIR', str(tmp_path))
+    return app_module.app.test_client()
+
+
+def test_import_from_another_directory(tmp_path):
+    env = dict(os.environ, PYTHONPATH=APP_DIR)
+    result = subprocess.run([sys.executable, '-c', 'import app'],
+                            cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_configs_dir_is_anchored_to_app():
+    assert app_module.CONFIGS_DIR == os.path.join(APP_DIR, 'configs')
+
+
+def test_generate_and_serve(client):
+    r = client.post('/generate', data={'mac': 'AA:BB:CC:DD:EE:FF', 'lan_ip': '10.0.0.1/24'})
+    assert r.status_code == 200
+    assert r.json['config_url'] == '/config/aabbccddeeff.rsc'
+
+    r = client.get('/config/aabbccddeeff.rsc')
+    assert r.status_code == 200
+    assert b'address=10.0.0.1/24' in r.data
+
+
+def test_generate_requires_mac_and_lan_ip(client):
+    assert client.post('/generate', data={'mac': 'aa'}).status_code == 400
+
+
+def test_serve_uses_x_sendfile_when_enabled(client, tmp_path, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'USE_X_SENDFILE', True)
+    client.post('/generate', data={'mac': 'aa', 'lan_ip': '10.0.0.1/24'})
+
+    r = client.get('/config/aa.rsc')
+    assert r.headers['X-Sendfile'] == str(tmp_path / 'aa.rsc')
+    assert r.data == b''
+
+
+def test_generate_leaves_no_temp_files(client, tmp_path):
+    client.post('/generate', data={'mac': 'aa', 'lan_ip': '10.0.0.1/24'})
+    assert os.listdir(tmp_path) == ['aa.rsc']
+
+
+def test_failed_write_removes_temp_file(client, tmp_path, monkeypatch):
+    def failing_fsync(fd):
+        raise OSError('disk full')
+    monkeypatch.setattr(app_module.os, 'fsync', failing_fsync)
+
+    r = client.post('/generate', data={'mac': 'aa', 'lan_ip': '10.0.0.1/24'})
+    assert r.status_code == 500
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.fixture
+def index_renders(monkeypatch):
+    monkeypatch.setattr(app_module, '_index_html', None)
+    renders = []
+    real_render_template = app_module.render_template
+
+    def counting_render_template(name):
+        renders.append(name)
+        return real_render_template(name)
+    monkeypatch.setattr(app_module, 'render_template', counting_render_template)
+    return renders
+
+
+def test_index_is_rendered_once(client, index_renders, monkeypatch):
+    monkeypatch.setattr(app_module.app, 'debug', False)
+    first = client.get('/').data
+    second = client.get('/').data
+
+    assert b'Mikrotik Config Generator' in first
+    assert first == second
+    assert index_renders == ['index.html']
+
+
+def test_index_is_rerendered_in_debug(client, index_renders, monkeypatch):
+    monkeypatch.setattr(app_module.app, 'debug', True)
+    first = client.get('/').data
+    second = client.get('/').data
+
+    assert first == second
+    assert index_renders == ['index.html', 'index.html']
@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for production servers, e.g.:
+
+    gunicorn -w 2 -k gthread --threads 8 wsgi:app
+"""
+
+from app import app